@@ -29,6 +29,28 @@ CONFERENCE_NAME = "ICLR2026"
 # Directory where OpenReview data will be cached
 CACHE_ROOT = f"data/{CONFERENCE_NAME}/"
 
+# Maximum age (in seconds) of cached data before it is downloaded again
+# (None keeps cached data until REFRESH_CACHE is set)
+CACHE_TTL_SECONDS = 3600
+
+# Set to True to ignore cached data and re-download it from OpenReview
+# (the cached submission listing is only used to narrow down candidate papers;
+# the papers written to the sheet are always fetched live)
+REFRESH_CACHE = False
+
+# ============================================================================
+# OPENREVIEW API CONFIGURATION
+# ============================================================================
+# Number of concurrent requests used when fetching submissions and forums
+OPENREVIEW_MAX_WORKERS = 8
+
+# Upper bound on requests sent to OpenReview per minute (None disables throttling)
+OPENREVIEW_MAX_REQUESTS_PER_MINUTE = 300
+
+# Number of attempts for each request before giving up on connection errors
+# (at least 1; HTTP 429/5xx responses are retried by the OpenReview client itself)
+OPENREVIEW_MAX_RETRIES = 3
+
 # ============================================================================
 # GOOGLE SHEETS CONFIGURATION
 # ============================================================================
@@ -69,6 +91,82 @@ INITIALIZE_SHEET = False
 # to match your conference's OpenReview structure.
 # ============================================================================
 
+def _make_neurips_style_extractors():
+    """
+    Build the NOTE_EXTRACTORS shared by conferences that use the NeurIPS-style
+    OpenReview workflow (reviews, rebuttals, discussion and AC letters).
+
+    Returns a fresh dict so that one conference can be customized without
+    affecting the others.
+    """
+    return {
+        'review': lambda note: any(
+            invitation.endswith('Official_Review') for invitation in note.invitations
+        ),
+        'final_justification': lambda note: (
+            "final_justification" in note.content
+            and any(invitation.endswith('Official_Review') for invitation in note.invitations)
+        ),
+        'other_comment': lambda note: (
+            any(invitation.endswith('Official_Comment') for invitation in note.invitations)
+            and not (
+                any(
+                    writer.rsplit('/', 1)[-1].startswith('Reviewer')
+                    for writer in note.writers
+                )
+                and any(
+                    reader.rsplit('/', 1)[-1].startswith('Author')
+                    for reader in note.readers
+                )
+            )
+        ),
+        'discussion_comment': lambda note: (
+            any(
+                invitation.endswith('Official_Comment')
+                for invitation in note.invitations
+            )
+            and any(
+                writer.rsplit('/', 1)[-1].startswith('Reviewer')
+                for writer in note.writers
+            )
+            and any(
+                reader.rsplit('/', 1)[-1].startswith('Author')
+                for reader in note.readers
+            )
+        ),
+        'rebuttal': lambda note: any(
+            invitation.endswith('Rebuttal')
+            for invitation in note.invitations
+        ),
+        'rebuttal_acknowledgement': lambda note: (
+            any(
+                invitation.endswith('Mandatory_Acknowledgement')
+                for invitation in note.invitations
+            )
+        ),
+        'ac_letter_author': lambda note: (
+            any(
+                invitation.endswith('Author_AC_Confidential_Comment')
+                for invitation in note.invitations
+            )
+            and any(
+                writer.rsplit('/', 1)[-1].startswith('Author')
+                for writer in note.writers
+            )
+        ),
+        'ac_letter_ac': lambda note: (
+            any(
+                invitation.endswith('Author_AC_Confidential_Comment')
+                for invitation in note.invitations
+            )
+            and any(
+                writer.rsplit('/', 1)[-1].startswith('Area_Chair')
+                for writer in note.writers
+            )
+        ),
+    }
+
+
 CONFERENCE_INFO = {
     "ICML2025": dict(
         CONFERENCE_ID = 'ICML.cc/2025/Conference',
@@ -112,72 +210,7 @@ CONFERENCE_INFO = {
             else None
         ),
         PAPER_NUMBER_EXTRACTOR = lambda paper: paper.number,
-        NOTE_EXTRACTORS = {
-            'review': lambda note: any(
-                invitation.endswith('Official_Review') for invitation in note.invitations
-            ),
-            'final_justification': lambda note: (
-                "final_justification" in note.content
-                and any(invitation.endswith('Official_Review') for invitation in note.invitations)
-            ),
-            'other_comment': lambda note: (
-                any(invitation.endswith('Official_Comment') for invitation in note.invitations)
-                and not (
-                    any(
-                        writer for writer in note.writers
-                        if writer.split('/')[-1].startswith('Reviewer')
-                    )
-                    and any(
-                        reader for reader in note.readers
-                        if reader.split('/')[-1].startswith('Author')
-                    )
-                )
-            ),
-            'discussion_comment': lambda note: (
-                any(
-                    invitation.endswith('Official_Comment')
-                    for invitation in note.invitations
-                )
-                and any(
-                    writer for writer in note.writers
-                    if writer.split('/')[-1].startswith('Reviewer')
-                )
-                and any(
-                    reader for reader in note.readers
-                    if reader.split('/')[-1].startswith('Author')
-                )
-            ),
-            'rebuttal': lambda note: any(
-                invitation.endswith('Rebuttal')
-                for invitation in note.invitations
-            ),
-            'rebuttal_acknowledgement': lambda note: (
-                any(
-                    invitation.endswith('Mandatory_Acknowledgement')
-                    for invitation in note.invitations
-                )
-            ),
-            'ac_letter_author': lambda note: (
-                any(
-                    invitation.endswith('Author_AC_Confidential_Comment')
-                    for invitation in note.invitations
-                )
-                and any(
-                    writer for writer in note.writers
-                    if writer.split('/')[-1].startswith('Author')
-                )
-            ),
-            'ac_letter_ac': lambda note: (
-                any(
-                    invitation.endswith('Author_AC_Confidential_Comment')
-                    for invitation in note.invitations
-                )
-                and any(
-                    writer for writer in note.writers
-                    if writer.split('/')[-1].startswith('Area_Chair')
-                )
-            ),
-        }
+        NOTE_EXTRACTORS = _make_neurips_style_extractors(),
     ),
     "ICLR2026": dict(
         CONFERENCE_ID = 'ICLR.cc/2026/Conference',
@@ -187,75 +220,7 @@ CONFERENCE_INFO = {
             else None
         ),
         PAPER_NUMBER_EXTRACTOR = lambda paper: paper.number,
-        NOTE_EXTRACTORS = {
-            'review': lambda note: any(
-                invitation.endswith('Official_Review') for invitation in note.invitations
-            ),
-            'final_justification': lambda note: (
-                "final_justification" in note.content
-                and any(invitation.endswith('Official_Review') for invitation in note.invitations)
-            ),
-            'other_comment': lambda note: (
-                any(
-                    invitation.endswith('Official_Comment')
-                    for invitation in note.invitations
-                )
-                and not (
-                    any(
-                        writer for writer in note.writers
-                        if writer.split('/')[-1].startswith('Reviewer')
-                    )
-                    and any(
-                        reader for reader in note.readers
-                        if reader.split('/')[-1].startswith('Author')
-                    )
-                )
-            ),
-            'discussion_comment': lambda note: (
-                any(
-                    invitation.endswith('Official_Comment')
-                    for invitation in note.invitations
-                )
-                and any(
-                    writer for writer in note.writers
-                    if writer.split('/')[-1].startswith('Reviewer')
-                )
-                and any(
-                    reader for reader in note.readers
-                    if reader.split('/')[-1].startswith('Author')
-                )
-            ),
-            'rebuttal': lambda note: any(
-                invitation.endswith('Rebuttal')
-                for invitation in note.invitations
-            ),
-            'rebuttal_acknowledgement': lambda note: (
-                any(
-                    invitation.endswith('Mandatory_Acknowledgement')
-                    for invitation in note.invitations
-                )
-            ),
-            'ac_letter_author': lambda note: (
-                any(
-                    invitation.endswith('Author_AC_Confidential_Comment')
-                    for invitation in note.invitations
-                )
-                and any(
-                    writer for writer in note.writers
-                    if writer.split('/')[-1].startswith('Author')
-                )
-            ),
-            'ac_letter_ac': lambda note: (
-                any(
-                    invitation.endswith('Author_AC_Confidential_Comment')
-                    for invitation in note.invitations
-                )
-                and any(
-                    writer for writer in note.writers
-                    if writer.split('/')[-1].startswith('Area_Chair')
-                )
-            ),
-        }
+        NOTE_EXTRACTORS = _make_neurips_style_extractors(),
     )
 }[CONFERENCE_NAME]
 
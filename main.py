@@ -30,11 +30,17 @@ import logging
 from utils.gsheet import GSheetWithHeader
 from utils.openreview import OpenReviewPapers
 from config import (
+    CACHE_ROOT,
+    CACHE_TTL_SECONDS,
     CONFERENCE_INFO,
     GSHEET_CREDENTIALS_PATH,
     GSHEET_TITLE,
     GSHEET_SHEET,
-    INITIALIZE_SHEET
+    INITIALIZE_SHEET,
+    OPENREVIEW_MAX_WORKERS,
+    OPENREVIEW_MAX_REQUESTS_PER_MINUTE,
+    OPENREVIEW_MAX_RETRIES,
+    REFRESH_CACHE
 )
 
 # Configure logging
@@ -52,6 +58,46 @@ class OpenReviewACPapers(OpenReviewPapers):
     papers assigned to an Area Chair and extracting relevant review and discussion
     information using conference-specific logic as defined in CONFERENCE_INFO.
     """
+    @staticmethod
+    def _average_score(scores):
+        """
+        Average the available scores in a single pass.
+
+        Args:
+            scores: List of scores; None entries (missing ratings) are skipped
+
+        Returns:
+            Average rounded to 2 decimals, or 'N/A' if no score is available
+        """
+        total = 0
+        count = 0
+        for score in scores:
+            if score is not None:
+                total += score
+                count += 1
+        return round(total / count, 2) if count else 'N/A'
+
+    def _get_submission(self, paper_num):
+        """
+        Retrieve a single submission by paper number.
+
+        Args:
+            paper_num: OpenReview paper number
+
+        Returns:
+            List of matching submission notes (empty if retrieval failed)
+        """
+        try:
+            paper_notes = self._get_notes(
+                invitation=f'{self.conference_id}/-/Submission',
+                number=paper_num
+            )
+            logging.debug("Retrieved paper %d", paper_num)
+            return paper_notes
+        except (ValueError, KeyError, AttributeError) as e:
+            logging.warning("Failed to retrieve paper %d: %s", paper_num, e)
+            return []
+
     def get_ac_papers_list(self):
         """
         Retrieve and process all papers assigned to you as an Area Chair.
@@ -99,7 +145,7 @@ class OpenReviewACPapers(OpenReviewPapers):
             logging.warning("No AC information for %s.", self.conference_id)
             return []
 
-        profile = self.openreview_client.get_profile()
+        profile = self.profile
         if profile.id not in ac_group_list:
             logging.warning("You are not an area chair for %s.", self.conference_id)
             return []
@@ -148,59 +194,51 @@ class OpenReviewACPapers(OpenReviewPapers):
             logging.info("No specific AC assignments found, will use paper.readers method (legacy)")
             logging.info("Found %d pool AC groups for %s", len(pool_ac_groups), self.conference_id)
 
-        if assigned_paper_numbers:
-            logging.info("Pre-filtered %d assigned paper numbers", len(assigned_paper_numbers))
-            logging.info("Assigned papers: %s", sorted(list(assigned_paper_numbers)))
+        sorted_paper_nums = sorted(assigned_paper_numbers)
+        if sorted_paper_nums:
+            logging.info("Pre-filtered %d assigned paper numbers", len(sorted_paper_nums))
+            logging.info("Assigned papers: %s", sorted_paper_nums)
+
+        pool_ac_group_set = set(pool_ac_groups)
 
         # Retrieve submissions - optimize by fetching only assigned papers if possible
         if use_specific_assignment and assigned_paper_numbers:
             # Optimization: fetch only the papers we know are assigned
             logging.info("Retrieving only assigned submissions (optimized)")
+            submissions_by_number = self._concurrent_map(
+                self._get_submission, sorted_paper_nums, desc="Fetching submissions"
+            )
             submissions = []
-            for paper_num in sorted(assigned_paper_numbers):
-                try:
-                    paper_notes = self.openreview_client.get_notes(
-                        invitation=f'{self.conference_id}/-/Submission',
-                        details='replicated',
-                        number=paper_num
-                    )
-                    if paper_notes:
-                        submissions.extend(paper_notes)
-                        logging.debug("Retrieved paper %d", paper_num)
-                except (ValueError, KeyError, AttributeError) as e:
-                    logging.warning("Failed to retrieve paper %d: %s", paper_num, e)
+            for paper_num in sorted_paper_nums:
+                submissions.extend(submissions_by_number[paper_num])
             logging.info("Retrieved %d assigned submissions", len(submissions))
         else:
             # Fallback: retrieve all submissions (needed for legacy method)
             logging.info("Retrieving all submissions (legacy method)")
-            all_submissions = []
-            offset = 0
-            batch_size = 1000
-
-            while True:
-                submissions_batch = self.openreview_client.get_notes(
-                    invitation=f'{self.conference_id}/-/Submission',
-                    details='replicated',
-                    limit=batch_size,
-                    offset=offset
+            if self.cache is not None:
+                # The cached listing may be up to CACHE_TTL_SECONDS old, so it only
+                # narrows down candidates (a pool AC group reads its paper from the
+                # start); they are fetched live so withdrawals, titles and readers
+                # below are up to date
+                candidate_numbers = [
+                    paper.number for paper in self.get_all_submissions()
+                    if not pool_ac_group_set.isdisjoint(paper.readers)
+                ]
+                submissions_by_number = self._concurrent_map(
+                    self._get_submission, candidate_numbers, desc="Fetching submissions"
                 )
-                if not submissions_batch:
-                    break
-                all_submissions.extend(submissions_batch)
-                logging.info("Retrieved %d submissions (total: %d)", len(submissions_batch), len(all_submissions))
-                offset += batch_size
-
-                # Stop if we got less than a full batch (means we're at the end)
-                if len(submissions_batch) < batch_size:
-                    break
-
-            submissions = all_submissions
-            logging.info("Found %d total submissions", len(submissions))
+                submissions = []
+                for paper_num in candidate_numbers:
+                    submissions.extend(submissions_by_number[paper_num])
+            else:
+                # Nothing to cache, so filter pages as they arrive
+                submissions = self._iter_submissions()
 
-        paper_data = []
         logging.info("Processing papers assigned to AC")
         papers_checked = 0
-        papers_matched = 0
+        assigned_papers = []
+        # Checked once: the legacy method may skip thousands of papers below
+        debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
 
         for paper in submissions:
             papers_checked += 1
@@ -214,22 +252,38 @@ class OpenReviewACPapers(OpenReviewPapers):
             else:
                 # Method 2: Legacy method - check paper.readers (NeurIPS/ICCV style)
                 ac_group_id_for_paper = f'{self.conference_id}/Submission{paper.number}/Area_Chairs'
-                if ac_group_id_for_paper in paper.readers:
+                readers = set(paper.readers)
+                if ac_group_id_for_paper in readers:
                     # Also check if you're actually in one of the AC groups for this paper
-                    if any(ac_group in paper.readers for ac_group in pool_ac_groups):
+                    if not pool_ac_group_set.isdisjoint(readers):
                         is_assigned = True
 
             if not is_assigned:
-                logging.debug("Paper %d is not assigned to you as AC.", paper.number)
+                if debug_enabled:
+                    logging.debug("Paper %d is not assigned to you as AC.", paper.number)
                 continue
 
-            papers_matched += 1
-            logging.info("Processing assigned paper %d", paper.number)
+            assigned_papers.append(paper)
 
-            logging.debug("Processing paper %d", paper.number)
-            all_notes = self.openreview_client.get_notes(forum=paper.forum)
+        papers_matched = len(assigned_papers)
+
+        # Fetch every forum up front (one request per forum) instead of
+        # querying the same forum twice inside the per-paper loop
+        notes_by_forum = self.get_forum_notes([paper.forum for paper in assigned_papers])
+
+        # Hoisted out of the per-paper loop: count keys and extractors are fixed per conference
+        note_extractor_items = [
+            (note_key + '_count', note_extractor)
+            for note_key, note_extractor in CONFERENCE_INFO['NOTE_EXTRACTORS'].items()
+        ]
+        note_counts_template = {count_key: 0 for count_key, _ in note_extractor_items}
+
+        paper_data = []
+        for paper in assigned_papers:
+            logging.info("Processing assigned paper %d", paper.number)
+            forum_notes = notes_by_forum.get(paper.forum, [])
             invitation_str = f'{self.conference_id}/Submission{paper.number}/-/Official_Review'
-            reviews = [note for note in all_notes if invitation_str in note.invitations]
+            reviews = [note for note in forum_notes if invitation_str in note.invitations]
             scores = (
                 [CONFERENCE_INFO['RATING_EXTRACTOR'](review) for review in reviews]
                 if 'RATING_EXTRACTOR' in CONFERENCE_INFO
@@ -242,23 +296,16 @@ class OpenReviewACPapers(OpenReviewPapers):
                 final_scores = [
                     CONFERENCE_INFO['FINAL_RATING_EXTRACTOR'](review) for review in reviews
                 ]
-                # Filter out None values for average calculation
-                final_scores_filtered = [score for score in final_scores if score is not None]
-            else:
-                final_scores_filtered = []
 
-            forum_notes = self.openreview_client.get_notes(forum=paper.forum)
             participating_reviewers = [
                 note.signatures[0] for note in forum_notes if 'comment' in note.content
             ]
 
-            note_counts = {
-                note_key + '_count': 0 for note_key in CONFERENCE_INFO['NOTE_EXTRACTORS']
-            }
+            note_counts = note_counts_template.copy()
             for note in forum_notes:
-                for key, note_extractor in CONFERENCE_INFO['NOTE_EXTRACTORS'].items():
+                for count_key, note_extractor in note_extractor_items:
                     if note_extractor(note):
-                        note_counts[key + '_count'] += 1
+                        note_counts[count_key] += 1
 
             note_counts['others_count'] = len(forum_notes) - sum(note_counts.values())
 
@@ -266,21 +313,17 @@ class OpenReviewACPapers(OpenReviewPapers):
 
             paper_data.append({
                 'paper_title': paper.content['title']['value'],
-                'withdrawn': 'Withdrawn' in paper.content.get('venue', {}).get('value', ''),
+                'withdrawn': 'Withdrawn' in (paper.content.get('venue', {}).get('value') or ''),
                 'paper_number': CONFERENCE_INFO['PAPER_NUMBER_EXTRACTOR'](paper),
                 'paper_url': paper_url,
                 'num_reviewers': len(reviews),
-                'avg_score': round(sum(scores) / len(scores), 2) if scores else 'N/A',
+                'avg_score': self._average_score(scores),
                 'reviewer1_score': scores[0] if len(scores) >= 1 else '',
                 'reviewer2_score': scores[1] if len(scores) >= 2 else '',
                 'reviewer3_score': scores[2] if len(scores) >= 3 else '',
                 'reviewer4_score': scores[3] if len(scores) >= 4 else '',
                 'reviewer5_score': scores[4] if len(scores) >= 5 else '',
-                'avg_final_score': (
-                    round(sum(final_scores_filtered) / len(final_scores_filtered), 2)
-                    if final_scores_filtered
-                    else 'N/A'
-                ),
+                'avg_final_score': self._average_score(final_scores),
                 'reviewer1_final_score': final_scores[0] if len(final_scores) >= 1 else '',
                 'reviewer2_final_score': final_scores[1] if len(final_scores) >= 2 else '',
                 'reviewer3_final_score': final_scores[2] if len(final_scores) >= 3 else '',
@@ -305,6 +348,12 @@ def main():
     """
     openreview_papers = OpenReviewACPapers(
         conference_id=CONFERENCE_INFO['CONFERENCE_ID'],
+        max_workers=OPENREVIEW_MAX_WORKERS,
+        max_requests_per_minute=OPENREVIEW_MAX_REQUESTS_PER_MINUTE,
+        max_retries=OPENREVIEW_MAX_RETRIES,
+        cache_root=CACHE_ROOT,
+        cache_ttl_seconds=CACHE_TTL_SECONDS,
+        refresh_cache=REFRESH_CACHE,
     )
     ac_papers_list = openreview_papers.get_ac_papers_list()
 
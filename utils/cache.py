@@ -0,0 +1,136 @@
+"""
+On-disk cache for OpenReview data.
+
+This module stores pickled Python objects under a cache directory so that
+expensive OpenReview downloads (e.g. full submission lists) can be reused
+between runs.
+"""
+from concurrent.futures import ThreadPoolExecutor
+import atexit
+import hashlib
+import logging
+import os
+import pickle
+import time
+
+
+class DiskCache(object):
+    """
+    Pickle-backed key/value cache stored on disk.
+
+    Entries loaded or saved during the process are also kept in memory, so
+    repeated loads of the same key skip disk I/O and unpickling. Callers
+    share the returned object and should not mutate it.
+
+    Attributes:
+        cache_root: Directory where cache files are stored
+        ttl_seconds: Maximum age of a cache file before it is considered stale
+    """
+    def __init__(self, cache_root, ttl_seconds=None):
+        """
+        Args:
+            cache_root: Directory where cache files are stored (created on first save)
+            ttl_seconds: Maximum age of a cache file in seconds (default: never expires)
+        """
+        self.cache_root = cache_root
+        self.ttl_seconds = ttl_seconds
+        self._memory = {}
+        # Single writer thread so saves never block the caller and never race
+        self._writer = ThreadPoolExecutor(max_workers=1)
+        atexit.register(self._writer.shutdown, wait=True)
+
+    def _get_cache_path(self, cache_key):
+        """
+        Return the file path used to store cache_key.
+
+        Keys are hashed so that arbitrary characters and lengths map to a
+        valid, fixed-size file name.
+        """
+        key_hash = hashlib.blake2b(cache_key.encode(), digest_size=16).hexdigest()
+        return os.path.join(self.cache_root, key_hash + '.pkl')
+
+    def load(self, cache_key):
+        """
+        Load cached data.
+
+        Args:
+            cache_key: Key the data was saved under
+
+        Returns:
+            The cached data, or None if there is no usable (or fresh) cache entry
+        """
+        if cache_key in self._memory:
+            return self._memory[cache_key]
+        cache_path = self._get_cache_path(cache_key)
+        if not os.path.exists(cache_path):
+            return None
+        if self.ttl_seconds is not None:
+            age = time.time() - os.path.getmtime(cache_path)
+            if age > self.ttl_seconds:
+                logging.info("Cache for %s expired (%d seconds old)", cache_key, age)
+                return None
+        try:
+            with open(cache_path, 'rb') as f:
+                data = pickle.load(f)
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+            logging.warning("Ignoring unreadable cache file %s: %s", cache_path, e)
+            return None
+        logging.info("Loaded %s from cache", cache_key)
+        self._memory[cache_key] = data
+        return data
+
+    def load_or_fetch(self, cache_key, fetch_fn):
+        """
+        Load cached data, or fetch and cache it if there is no fresh entry.
+
+        Args:
+            cache_key: Key the data is stored under
+            fetch_fn: Callable with no arguments returning the data to cache
+
+        Returns:
+            The cached or freshly fetched data
+        """
+        data = self.load(cache_key)
+        if data is None:
+            data = fetch_fn()
+            self.save(cache_key, data)
+        return data
+
+    def save(self, cache_key, data):
+        """
+        Save data to the cache in the background.
+
+        The entry is available to load() immediately; the file is written by a
+        background thread and flushed before the interpreter exits. The data
+        must not be mutated after it has been saved.
+
+        Args:
+            cache_key: Key to save the data under
+            data: Any picklable object
+        """
+        self._memory[cache_key] = data
+        future = self._writer.submit(self._save_sync, cache_key, data)
+        future.add_done_callback(self._log_save_error)
+
+    @staticmethod
+    def _log_save_error(future):
+        """Report a failed background save (the run itself can continue)."""
+        error = future.exception()
+        if error is not None:
+            logging.warning("Failed to write cache file: %s", error)
+
+    def _save_sync(self, cache_key, data):
+        """
+        Write data to its cache file.
+
+        Data is pickled straight into a temporary file (no intermediate bytes
+        buffer) with the highest pickle protocol, then moved into place so
+        readers never see a partially written file.
+        """
+        os.makedirs(self.cache_root, exist_ok=True)
+        cache_path = self._get_cache_path(cache_key)
+        tmp_path = cache_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+        logging.info("Saved %s to cache", cache_key)
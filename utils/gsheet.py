@@ -14,6 +14,13 @@ class GSheetWithHeader(GSheetManager):
             self._headers = self.local_sheet_values[0]
         return self._headers
 
+    def _header_indices(self):
+        """Map each header name to its (first) column index."""
+        header_indices = {}
+        for header_idx, header_name in enumerate(self.headers or []):
+            header_indices.setdefault(header_name, header_idx)
+        return header_indices
+
     def clear_worksheet(self):
         self._worksheet.clear()
         self._headers = None
@@ -42,6 +49,7 @@ class GSheetWithHeader(GSheetManager):
         """
         current_row_idx = start_row_idx
         current_header_idx = len(self.headers) if self.headers else 0
+        existing_header_indices = self._header_indices()
 
         if overwrite:
             _headers = [None] * len(headers)
@@ -57,8 +65,8 @@ class GSheetWithHeader(GSheetManager):
                                        value=header_name)
                 _headers[header_idx] = header_name
             else:
-                if self.headers and header_name in self.headers:
-                    header_original_idx = self.headers.index(header_name)
+                if header_name in existing_header_indices:
+                    header_original_idx = existing_header_indices[header_name]
                     _headers[header_original_idx] = header_name
 
                 else:
@@ -85,14 +93,24 @@ class GSheetWithHeader(GSheetManager):
         Returns:
             Index of the next available row after writing
         """
-        current_row_idx = start_row_idx
-        for row_idx, d in enumerate(data_list_batch):
-            for header_idx, header_name in enumerate(headers):
-                if header_name in d:
-                    self._set_buffer_cells(python_row_idx=start_row_idx + row_idx,
-                                           python_col_idx=header_idx,
-                                           value=d[header_name])
-            current_row_idx += 1
+        cells = [
+            self._instantiate_cell_object(python_row_idx=start_row_idx + row_idx,
+                                          python_col_idx=header_idx,
+                                          value=d[header_name])
+            for row_idx, d in enumerate(data_list_batch)
+            for header_idx, header_name in enumerate(headers)
+            if header_name in d
+        ]
+        if self.buffer_cells:
+            for cell in cells:
+                self._set_buffer_cells(python_row_idx=cell.row - 1,
+                                       python_col_idx=cell.col - 1,
+                                       value=cell.value)
+        else:
+            # Every (row, col) in the batch is unique, so skip _set_buffer_cells,
+            # which scans the whole buffer for each cell (quadratic per batch)
+            self.buffer_cells.extend(cells)
+        current_row_idx = start_row_idx + len(data_list_batch)
         logging.debug("Batch of %d rows written starting at row %d", len(data_list_batch), start_row_idx)
         return current_row_idx
 
@@ -153,22 +171,34 @@ class GSheetWithHeader(GSheetManager):
             overwrite: If True, overwrite existing non-empty cells; if False, skip them
         """
         updates_count = 0
+        header_indices = self._header_indices()
+        # One index per set of condition keys: (values of those columns) -> first matching row
+        row_indices = {}
         for where_, what_ in zip(where, what):
-            try:
-                python_row_idx = next(i for i, row in enumerate(self.local_sheet_values)
-                              if all(row[self.headers.index(k)] == v for k, v in where_.items()))
-            except StopIteration:
+            condition_keys = tuple(where_)
+            if condition_keys not in row_indices:
+                key_cols = [header_indices[k] for k in condition_keys]
+                row_index = {}
+                for row_idx, row in enumerate(self.local_sheet_values):
+                    row_index.setdefault(tuple(row[c] for c in key_cols), row_idx)
+                row_indices[condition_keys] = row_index
+
+            python_row_idx = row_indices[condition_keys].get(tuple(where_.values()))
+            if python_row_idx is None:
                 logging.warning("No matching row found for conditions: %s", where_)
                 continue
 
             for col_header, value in what_.items():
-                try:
-                    python_col_idx = self.headers.index(col_header)
-                except ValueError:
+                python_col_idx = header_indices.get(col_header)
+                if python_col_idx is None:
                     logging.warning("Column header '%s' not found in headers", col_header)
                     continue
 
                 current_value = self.local_sheet_values[python_row_idx][python_col_idx]
+                # Sheet values are read back as strings; unchanged cells need no upload
+                if str(current_value) == str(value):
+                    continue
+
                 if current_value and current_value != value and not overwrite:
                     logging.warning("Skipping non-empty cell at row %d, column %s. Current value: '%s', New value: '%s'", python_row_idx + 1, col_header, current_value, value)
                     continue
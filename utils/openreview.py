@@ -4,8 +4,54 @@ OpenReview API client wrapper for managing conference papers.
 This module provides a base class for interacting with the OpenReview API,
 handling authentication and basic conference operations.
 """
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import logging
+import threading
+import time
 import openreview
 import os
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import tqdm
+from utils.cache import DiskCache
+
+# Errors worth retrying: dropped or stalled connections. HTTP 429/5xx responses
+# are already retried (with backoff and Retry-After) by the session adapter, and
+# other API errors such as 403/404 will not succeed on a second attempt.
+RETRYABLE_ERRORS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+)
+
+
+class RateLimiter(object):
+    """
+    Thread-safe limiter that spaces out requests evenly over time.
+
+    Attributes:
+        interval: Minimum number of seconds between two consecutive requests
+    """
+    def __init__(self, max_requests_per_minute=None):
+        """
+        Args:
+            max_requests_per_minute: Maximum number of requests per minute
+                (None or 0 disables throttling)
+        """
+        self.interval = 60.0 / max_requests_per_minute if max_requests_per_minute else 0.0
+        self._lock = threading.Lock()
+        self._next_request_time = 0.0
+
+    def wait(self):
+        """Block until the next request is allowed to start."""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            wait_time = self._next_request_time - now
+            self._next_request_time = max(now, self._next_request_time) + self.interval
+        if wait_time > 0:
+            time.sleep(wait_time)
 
 
 class OpenReviewPapers(object):
@@ -18,24 +64,197 @@ class OpenReviewPapers(object):
     Attributes:
         openreview_client: Authenticated OpenReview API client instance
         conference_id: The OpenReview conference identifier (e.g., 'ICLR.cc/2026/Conference')
+        max_workers: Number of threads used for concurrent requests
+        max_retries: Number of attempts for each request on connection errors
+        cache: DiskCache for downloaded data, or None if caching is disabled
+        refresh_cache: If True, ignore cached data and re-download it
 
     Environment Variables:
         OPENREVIEW_USERNAME: Your OpenReview account email
         OPENREVIEW_PASSWORD: Your OpenReview account password
     """
-    def __init__(self, conference_id):
+    def __init__(self, conference_id, max_workers=8, max_requests_per_minute=None, max_retries=3,
+                 cache_root=None, cache_ttl_seconds=None, refresh_cache=False):
         """
         Initialize the OpenReview client with credentials from environment variables.
 
         Args:
             conference_id: The OpenReview conference identifier string
+            max_workers: Number of threads used for concurrent requests (default: 8)
+            max_requests_per_minute: Upper bound on the request rate (default: no limit)
+            max_retries: Number of attempts for each request on connection errors (default: 3)
+            cache_root: Directory for cached OpenReview data (default: no caching)
+            cache_ttl_seconds: Maximum age of cached data in seconds (default: never expires)
+            refresh_cache: If True, ignore existing cache entries and overwrite them
 
         Raises:
+            ValueError: If max_retries is less than 1
             Exception: If authentication fails or environment variables are not set
         """
+        if max_retries < 1:
+            raise ValueError(f"max_retries must be at least 1, got {max_retries}")
         self.openreview_client = openreview.api.OpenReviewClient(
             baseurl='https://api2.openreview.net',
             username=os.environ.get('OPENREVIEW_USERNAME'),
             password=os.environ.get('OPENREVIEW_PASSWORD'),
         )
         self.conference_id = conference_id
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self._rate_limiter = RateLimiter(max_requests_per_minute)
+        self._ensure_connection_pool()
+        self.cache = DiskCache(cache_root, ttl_seconds=cache_ttl_seconds) if cache_root else None
+        self.refresh_cache = refresh_cache
+        self._refreshed_keys = set()
+        self._profile = None
+
+    def _ensure_connection_pool(self):
+        """
+        Make sure the client's HTTP session keeps a connection per worker alive.
+
+        Recent openreview-py clients already mount a large, retrying adapter.
+        Older ones use requests' default pool of 10 connections, so concurrent
+        workers would keep opening (and discarding) TCP+TLS connections.
+        """
+        session = getattr(self.openreview_client, 'session', None)
+        if session is None:
+            return
+        adapter = session.get_adapter(self.openreview_client.baseurl)
+        if getattr(adapter, '_pool_maxsize', 0) >= self.max_workers:
+            return
+        max_retries = adapter.max_retries
+        if not max_retries.total:
+            max_retries = Retry(total=5, backoff_factor=0.3,
+                                status_forcelist=[429, 500, 502, 503, 504])
+        pooled_adapter = HTTPAdapter(pool_connections=self.max_workers,
+                                     pool_maxsize=self.max_workers,
+                                     max_retries=max_retries)
+        session.mount('https://', pooled_adapter)
+        session.mount('http://', pooled_adapter)
+        logging.debug("Mounted HTTP adapter with a pool of %d connections", self.max_workers)
+
+    @property
+    def profile(self):
+        """
+        Profile of the authenticated user, retrieved at most once per instance.
+
+        The client already records the profile (with its ID) at login, so the
+        extra get_profile() request is only made for clients that do not.
+        """
+        if self._profile is None:
+            self._profile = (getattr(self.openreview_client, 'profile', None)
+                             or self.openreview_client.get_profile())
+        return self._profile
+
+    def _load_or_fetch(self, cache_key, fetch_fn):
+        """Return cached data for cache_key, fetching (and caching) it if needed."""
+        if self.cache is None:
+            return fetch_fn()
+        if self.refresh_cache and cache_key not in self._refreshed_keys:
+            # Refresh each key once per run; save() keeps it in memory for later calls
+            data = fetch_fn()
+            self.cache.save(cache_key, data)
+            self._refreshed_keys.add(cache_key)
+            return data
+        return self.cache.load_or_fetch(cache_key, fetch_fn)
+
+    def _get_notes(self, **kwargs):
+        """
+        Call get_notes with throttling and exponential-backoff retries on connection errors.
+
+        Args:
+            **kwargs: Filters passed through to OpenReviewClient.get_notes
+
+        Returns:
+            List of notes matching the filters
+
+        Raises:
+            The last connection error if all attempts fail, or any other error immediately
+        """
+        for attempt in range(self.max_retries):
+            self._rate_limiter.wait()
+            try:
+                return self.openreview_client.get_notes(**kwargs)
+            except RETRYABLE_ERRORS as e:
+                if attempt == self.max_retries - 1:
+                    raise
+                delay = 2 ** attempt
+                logging.warning("get_notes(%s) failed (%s), retrying in %ds", kwargs, e, delay)
+                time.sleep(delay)
+
+    def _concurrent_map(self, func, items, desc=None):
+        """
+        Apply func to every item using a thread pool (requests are I/O-bound).
+
+        Args:
+            func: Callable taking a single item
+            items: Iterable of hashable items (duplicates are only processed once)
+            desc: Optional progress bar description
+
+        Returns:
+            dict: Mapping of each distinct item to func(item)
+        """
+        results = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(func, item): item for item in dict.fromkeys(items)}
+            for future in tqdm.tqdm(as_completed(futures), total=len(futures), desc=desc):
+                results[futures[future]] = future.result()
+        return results
+
+    def get_forum_notes(self, forums):
+        """
+        Retrieve all notes for each of the given forums concurrently.
+
+        Args:
+            forums: Iterable of forum IDs (one per submission)
+
+        Returns:
+            dict: Mapping of forum ID to the list of notes posted in that forum
+        """
+        notes_by_forum = self._concurrent_map(
+            lambda forum: self._get_notes(forum=forum), forums, desc="Fetching forums"
+        )
+        logging.info("Retrieved notes for %d forums", len(notes_by_forum))
+        return notes_by_forum
+
+    def _iter_submissions(self, batch_size=1000):
+        """
+        Lazily page through all submissions of the conference.
+
+        Args:
+            batch_size: Number of submissions requested per page (max 1000)
+
+        Yields:
+            Submission notes, one page at a time
+        """
+        offset = 0
+        total = 0
+        while True:
+            submissions_batch = self._get_notes(
+                invitation=f'{self.conference_id}/-/Submission',
+                limit=batch_size,
+                offset=offset
+            )
+            if not submissions_batch:
+                break
+            total += len(submissions_batch)
+            logging.info("Retrieved %d submissions (total: %d)", len(submissions_batch), total)
+            yield from submissions_batch
+            offset += batch_size
+
+            # Stop if we got less than a full batch (means we're at the end)
+            if len(submissions_batch) < batch_size:
+                break
+
+    def get_all_submissions(self):
+        """
+        Retrieve all submissions of the conference, using the on-disk cache if available.
+
+        Returns:
+            List of all submission notes
+        """
+        submissions = self._load_or_fetch(
+            f'{self.conference_id}/submissions', lambda: list(self._iter_submissions())
+        )
+        logging.info("Found %d total submissions", len(submissions))
+        return submissions